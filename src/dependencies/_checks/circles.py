@@ -2,23 +2,33 @@ from .._markers import injectable
 from ..exceptions import DependencyError
 
 
-def check_circles(dependencies):
+def check_circles(dependencies, origins=None):
 
-    for depname in dependencies:
+    if origins is None:
+        origins = dependencies
+    for depname in origins:
         check_circles_for(dependencies, depname, depname)
 
 
 def check_circles_for(dependencies, attrname, origin):
 
-    try:
-        argspec = dependencies[attrname]
-    except KeyError:
-        return
-
-    if argspec[0] is injectable:
-        args = argspec[2]
-        if origin in args:
-            message = "{0!r} is a circular dependency in the {1!r} constructor"
-            raise DependencyError(message.format(origin, argspec[1].__name__))
-        for name in args:
-            check_circles_for(dependencies, name, origin)
+    stack = [attrname]
+    seen = set(stack)
+
+    while stack:
+        attrname = stack.pop()
+
+        try:
+            argspec = dependencies[attrname]
+        except KeyError:
+            continue
+
+        if argspec[0] is injectable:
+            args = argspec[2]
+            if origin in args:
+                message = "{0!r} is a circular dependency in the {1!r} constructor"
+                raise DependencyError(message.format(origin, argspec[1].__name__))
+            for name in reversed(args):
+                if name not in seen:
+                    seen.add(name)
+                    stack.append(name)
@@ -2,9 +2,12 @@ from .._markers import injectable, nested_injector, this
 from ..exceptions import DependencyError
 
 
-def check_loops(class_name, dependencies):
+def check_loops(class_name, dependencies, origins=None):
 
-    for attrname, spec in dependencies.items():
+    if origins is None:
+        origins = dependencies
+    for attrname in origins:
+        spec = dependencies[attrname]
         if spec[0] is this:
             check_loops_for(
                 class_name, attrname, dependencies, spec, filter_expression(spec)
@@ -66,5 +69,5 @@ def nested_dependencies(parent, spec):
 
     result = {}
     result.update(spec[1].__dependencies__)
-    result.update({"__parent__": (injectable, parent, [], 0)})
+    result.update({"__parent__": (injectable, parent, (), 0)})
     return result
@@ -1,16 +1,31 @@
+import weakref
+
 from ._func import make_func_spec
 from ._markers import injectable
 
 
+init_specs = weakref.WeakKeyDictionary()
+
+
 def make_init_spec(dependency):
 
-    if using_object_init(dependency):
-        return injectable, dependency, [], 0
-    else:
-        name = dependency.__name__ + "." + "__init__"
-        owner_message = "{cls!r} class".format(cls=dependency.__name__)
-        args, have_defaults = make_func_spec(dependency.__init__, name, owner_message)
-        return injectable, dependency, args[1:], have_defaults
+    # The cached value must not reference the dependency class, or the
+    # weak key could never be collected.
+    try:
+        args, have_defaults = init_specs[dependency]
+    except KeyError:
+        if using_object_init(dependency):
+            args, have_defaults = (), 0
+        else:
+            name = dependency.__name__ + "." + "__init__"
+            owner_message = "{cls!r} class".format(cls=dependency.__name__)
+            args, have_defaults = make_func_spec(
+                dependency.__init__, name, owner_message
+            )
+            args = args[1:]
+        init_specs[dependency] = args, have_defaults
+
+    return injectable, dependency, args, have_defaults
 
 
 def using_object_init(cls):
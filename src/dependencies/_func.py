@@ -1,42 +1,35 @@
-import inspect
-
 from ._checks.func import check_cls_arguments, check_varargs
 
 
-if getattr(inspect, "signature", None):
-
-    def make_func_spec(func, funcname, owner_message):
-
-        signature = inspect.signature(func)
-        parameters = iter(signature.parameters.items())
-        args, defaults = [], []
-        varargs = kwargs = None
-        have_defaults = 0
-        for name, param in parameters:
+CO_VARARGS = 0x04
+CO_VARKEYWORDS = 0x08
+
+
+def make_func_spec(func, funcname, owner_message):
+
+    try:
+        code = func.__code__
+    except AttributeError:
+        # C-level constructors, like the ones inherited from builtin
+        # types, expose no code object.  They accept arbitrary
+        # arguments, so report them the same way.
+        check_varargs(funcname, True, True)
+    varargs = bool(code.co_flags & CO_VARARGS)
+    kwargs = bool(code.co_flags & CO_VARKEYWORDS)
+    check_varargs(funcname, varargs, kwargs)
+    argcount = code.co_argcount
+    args = list(code.co_varnames[:argcount])
+    defaults = list(func.__defaults__ or ())
+    have_defaults = argcount - len(defaults)
+    kwonlyargcount = getattr(code, "co_kwonlyargcount", 0)
+    if kwonlyargcount:
+        kwdefaults = func.__kwdefaults__ or {}
+        for name in code.co_varnames[argcount : argcount + kwonlyargcount]:
             args.append(name)
-            if param.default is not param.empty:
-                defaults.append(param.default)
+            if name in kwdefaults:
+                defaults.append(kwdefaults[name])
             else:
                 have_defaults += 1
-            if param.kind is param.VAR_POSITIONAL:
-                varargs = True
-            if param.kind is param.VAR_KEYWORD:
-                kwargs = True
-        check_varargs(funcname, varargs, kwargs)
-        if defaults:
-            check_cls_arguments(args, defaults, owner_message)
-        return args, have_defaults
-
-
-else:
-
-    def make_func_spec(func, funcname, owner_message):
-
-        args, varargs, kwargs, defaults = inspect.getargspec(func)
-        check_varargs(funcname, varargs, kwargs)
-        if defaults is not None:
-            check_cls_arguments(args, defaults, owner_message)
-            have_defaults = len(args) - len(defaults)
-        else:
-            have_defaults = len(args)
-        return args, have_defaults
+    if defaults:
+        check_cls_arguments(args, defaults, owner_message)
+    return tuple(args), have_defaults
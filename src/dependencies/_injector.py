@@ -1,3 +1,10 @@
+import weakref
+
+try:
+    from sys import intern
+except ImportError:  # pragma: no cover
+    intern = intern  # noqa: F821
+
 from ._attributes import Replace
 from ._checks.circles import check_circles
 from ._checks.injector import (
@@ -6,6 +13,7 @@ from ._checks.injector import (
     check_inheritance,
 )
 from ._checks.loops import check_loops
+from ._raw import RawSpec
 from ._replace import deep_replace_dependency
 from ._spec import InjectorTypeType, make_dependency_spec
 from .exceptions import DependencyError
@@ -25,29 +33,44 @@ class InjectorType(InjectorTypeType):
                 ns[attr] = namespace.pop(attr)
             except KeyError:
                 pass
-        for k, v in namespace.items():
-            check_dunder_name(k)
-            check_attrs_redefinition(k)
         dependencies = {}
         for base in reversed(bases):
             dependencies.update(base.__dependencies__)
         for name, dep in namespace.items():
-            dependencies[name] = make_dependency_spec(name, dep)
-        check_loops(class_name, dependencies)
-        check_circles(dependencies)
+            check_dunder_name(name)
+            check_attrs_redefinition(name)
+            dependencies[intern(name)] = make_dependency_spec(name, dep)
+        # The first base is a validated injector whose subgraph is known
+        # to be loop free.  Any loop in the merged graph goes through a
+        # spec the first base does not share, so those names are the
+        # only origins worth rechecking.
+        base_dependencies = bases[0].__dependencies__
+        changed = [
+            name
+            for name, spec in dependencies.items()
+            if base_dependencies.get(name) is not spec
+        ]
+        check_loops(class_name, dependencies, changed)
+        check_circles(dependencies, changed)
         ns["__dependencies__"] = dependencies
         return type.__new__(cls, class_name, bases, ns)
 
     def __getattr__(cls, attrname):
         __tracebackhide__ = True
 
+        dependencies = cls.__dependencies__
+
+        spec = dependencies.get(attrname)
+        if spec is not None and type(spec[1]) is RawSpec:
+            return spec[1].dependency
+
         cache, cached = {"__self__": cls}, {"__self__"}
         current_attr, attrs_stack = attrname, [attrname]
         have_default = False
 
         while attrname not in cache:
 
-            spec = cls.__dependencies__.get(current_attr)
+            spec = dependencies.get(current_attr)
 
             if spec is None:
                 if have_default:
@@ -71,7 +94,13 @@ class InjectorType(InjectorTypeType):
 
             marker, attribute, args, have_defaults = spec
 
-            if set(args).issubset(cached):
+            for n, arg in enumerate(args, 1):
+                if arg not in cached:
+                    attrs_stack.append(current_attr)
+                    current_attr = arg
+                    have_default = False if n < have_defaults else True
+                    break
+            else:
                 kwargs = {k: cache[k] for k in args if k in cache}
 
                 try:
@@ -88,21 +117,13 @@ class InjectorType(InjectorTypeType):
                     # Also, `Replace` doesn't change dependencies dict of its parent,
                     # so lazy import will be evaluated again and again.  This kills
                     # the whole point of `Replace`.
-                    check_loops(cls.__name__, cls.__dependencies__)
-                    check_circles(cls.__dependencies__)
+                    check_loops(cls.__name__, dependencies)
+                    check_circles(dependencies)
                     continue
 
                 cached.add(current_attr)
                 current_attr = attrs_stack.pop()
                 have_default = False
-                continue
-
-            for n, arg in enumerate(args, 1):
-                if arg not in cached:
-                    attrs_stack.append(current_attr)
-                    current_attr = arg
-                    have_default = False if n < have_defaults else True
-                    break
 
         return cache[attrname]
 
@@ -136,10 +157,29 @@ def __init__(self, *args, **kwargs):
     raise DependencyError("Do not instantiate Injector")
 
 
+let_cache = weakref.WeakKeyDictionary()
+
+literal_types = (bool, int, float, complex, str, bytes, type(None))
+
+
 def let(cls, **kwargs):
     """Produce new Injector with some dependencies overwritten."""
 
-    return type(cls.__name__, (cls,), kwargs)
+    for value in kwargs.values():
+        if not isinstance(value, literal_types):
+            return type(cls.__name__, (cls,), kwargs)
+
+    # The key carries each value's exact type, so overrides which
+    # compare equal across types, like 2 and 2.0 or True and 1, do not
+    # share a subclass.
+    key = tuple(sorted((name, type(value), value) for name, value in kwargs.items()))
+    subclasses = let_cache.get(cls)
+    if subclasses is None:
+        subclasses = let_cache[cls] = weakref.WeakValueDictionary()
+    subclass = subclasses.get(key)
+    if subclass is None:
+        subclass = subclasses[key] = type(cls.__name__, (cls,), kwargs)
+    return subclass
 
 
 injector_doc = """
@@ -5,7 +5,7 @@ from ._markers import injectable, nested_injector
 
 def make_nested_injector_spec(dependency):
 
-    return nested_injector, NestedInjectorSpec(dependency), ["__self__"], 0
+    return nested_injector, NestedInjectorSpec(dependency), ("__self__",), 0
 
 
 class NestedInjectorSpec(object):
@@ -16,7 +16,7 @@ class NestedInjectorSpec(object):
     def __call__(self, __self__):
 
         subclass = type(self.injector.__name__, (self.injector,), {})
-        parent = injectable, weakref.ref(__self__), [], 0
+        parent = injectable, weakref.ref(__self__), (), 0
         subclass.__dependencies__["__parent__"] = parent
         return subclass
 
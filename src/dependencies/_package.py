@@ -21,7 +21,7 @@ class Package(object):
 
 def make_package_spec(dependency):
 
-    return lazy_import, ImportSpec(dependency), [], 0
+    return lazy_import, ImportSpec(dependency), (), 0
 
 
 class ImportSpec(object):
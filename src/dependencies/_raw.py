@@ -3,7 +3,7 @@ from ._markers import injectable
 
 def make_raw_spec(dependency):
 
-    return injectable, RawSpec(dependency), [], 0
+    return injectable, RawSpec(dependency), (), 0
 
 
 class RawSpec(object):
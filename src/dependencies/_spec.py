@@ -18,7 +18,7 @@ def make_dependency_spec(name, dependency):
     # FIXME: Protect `Injector` from `_class` named attributes.
     if isinstance(dependency, InjectorTypeType):
         return make_nested_injector_spec(dependency)
-    elif inspect.isclass(dependency) and not name.endswith("_class"):
+    elif not name.endswith("_class") and inspect.isclass(dependency):
         return make_init_spec(dependency)
     elif isinstance(dependency, This):
         return make_this_spec(dependency)
@@ -32,7 +32,7 @@ this = This(tuple())
 def make_this_spec(dependency):
 
     check_expression(dependency)
-    return _markers.this, ThisSpec(dependency), ["__self__"], 0
+    return _markers.this, ThisSpec(dependency), ("__self__",), 0
 
 
 class ThisSpec(object):
@@ -49,10 +49,11 @@ class ThisSpec(object):
                 try:
                     result = getattr(result, symbol)
                 except DependencyError:
-                    message = (
-                        "You tries to shift this more times that Injector has levels"
-                    )
                     if symbol == "__parent__":
+                        message = (
+                            "You tries to shift this more times "
+                            "that Injector has levels"
+                        )
                         raise DependencyError(message)
                     else:
                         raise
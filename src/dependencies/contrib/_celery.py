@@ -1,8 +1,5 @@
 from __future__ import absolute_import
 
-import celery
-import celery.canvas
-
 from dependencies import Injector
 
 
@@ -18,6 +15,8 @@ def task(injector):
 def shared_task(injector):
     """Create Celery shared task from injector class."""
 
+    import celery
+
     return decorate_with(celery.shared_task, injector)
 
 
@@ -53,18 +52,45 @@ def decorate_with(func, injector):
             options[argument] = getattr(injector, argument)
 
     if "bind" in injector and injector.bind:
+        handler = make_bound_handler(injector)
+    else:
+        handler = make_handler(injector)
 
-        def __task(self, *args, **kwargs):
-            return injector.let(task=self, args=args, kwargs=kwargs).run()
+    func(**options)(handler)
 
-    else:
+    return add_task_mixin(injector)
+
+
+def make_bound_handler(injector):
+
+    let = injector.let
+
+    def __task(self, *args, **kwargs):
+        return let(task=self, args=args, kwargs=kwargs).run()
+
+    return __task
 
-        def __task(*args, **kwargs):  # type: ignore
-            return injector.let(args=args, kwargs=kwargs).run()
 
-    func(**options)(__task)
+def make_handler(injector):
 
-    return injector & TaskMixin
+    let = injector.let
+
+    def __task(*args, **kwargs):
+        return let(args=args, kwargs=kwargs).run()
+
+    return __task
+
+
+task_mixins = {}
+
+
+def add_task_mixin(injector):
+
+    try:
+        return task_mixins[injector]
+    except KeyError:
+        mixed = task_mixins[injector] = injector & TaskMixin
+        return mixed
 
 
 class Signature(object):
@@ -73,6 +99,8 @@ class Signature(object):
     `Injector` subclass.
     """
 
+    __slots__ = ("name", "app", "immutable", "options", "subtask_type", "extras")
+
     def __init__(
         self,
         name,
@@ -87,62 +115,85 @@ class Signature(object):
         self.immutable = immutable
         self.options = options
         self.subtask_type = subtask_type
+        extras = {}
+        if options is not undefined:
+            extras["options"] = options
+        if immutable is not undefined:
+            extras["immutable"] = immutable
+        if subtask_type is not undefined:
+            extras["subtask_type"] = subtask_type
+        self.extras = extras
 
     def __call__(self, args=None, kwargs=None, **ex):
 
-        if "options" not in ex and self.options is not undefined:
-            ex["options"] = self.options
-        if "immutable" not in ex and self.immutable is not undefined:
-            ex["immutable"] = self.immutable
-        if "subtask_type" not in ex and self.subtask_type is not undefined:
-            ex["subtask_type"] = self.subtask_type
+        import celery.canvas
+
+        merged = dict(self.extras)
+        merged.update(ex)
         return celery.canvas.Signature(
-            task=self.name, app=self.app, args=args, kwargs=kwargs, **ex
+            task=self.name, app=self.app, args=args, kwargs=kwargs, **merged
         )
 
 
 class Shortcut(Signature):
     """Create Celery canvas shortcut expression."""
 
+    __slots__ = ("immutable_value", "options_value", "subtask_type_value")
+
     immutable_default = False
 
+    def __init__(
+        self,
+        name,
+        app=None,
+        immutable=undefined,
+        options=undefined,
+        subtask_type=undefined,
+    ):
+
+        super(Shortcut, self).__init__(name, app, immutable, options, subtask_type)
+        self.immutable_value = (
+            self.immutable_default if immutable is undefined else immutable
+        )
+        self.options_value = None if options is undefined else options
+        self.subtask_type_value = None if subtask_type is undefined else subtask_type
+
     def __call__(self, *args, **kwargs):
 
+        import celery.canvas
+
         return celery.canvas.Signature(
             task=self.name,
             app=self.app,
             args=args,
             kwargs=kwargs,
-            immutable=(
-                self.immutable_default
-                if self.immutable is undefined
-                else self.immutable
-            ),
-            options={} if self.options is undefined else self.options,
-            subtask_type=(
-                None if self.subtask_type is undefined else self.subtask_type
-            ),
+            immutable=self.immutable_value,
+            options=self.options_value,
+            subtask_type=self.subtask_type_value,
         )
 
 
 class ImmutableShortcut(Shortcut):
     """Create immutable Celery canvas shortcut expression."""
 
+    __slots__ = ()
+
     immutable_default = True
 
 
 class Delay(Signature):
     """Delay execution of the task defined with `Injector` subclass."""
 
+    __slots__ = ()
+
     def __call__(self, *args, **kwargs):
 
         signature = super(Delay, self).__call__()
         return signature.delay(*args, **kwargs)
 
 
-class TaskMixin(Injector):  # type: ignore
-
-    signature = Signature
-    s = Shortcut
-    si = ImmutableShortcut
-    delay = Delay
+TaskMixin = type(Injector)(
+    "TaskMixin",
+    (Injector,),
+    {"signature": Signature, "s": Shortcut, "si": ImmutableShortcut, "delay": Delay},
+)
@@ -8,15 +8,16 @@ from dependencies.exceptions import DependencyError
 from helpers import CodeCollector
 
 
-def test_lambda_dependency():
-    """Inject lambda function."""
+class Foo(object):
+    def __init__(self, add):
+        self.add = add
 
-    class Foo(object):
-        def __init__(self, add):
-            self.add = add
+    def do(self, x):
+        return self.add(x, x)
 
-        def do(self, x):
-            return self.add(x, x)
+
+def test_lambda_dependency():
+    """Inject lambda function."""
 
     class Summator(Injector):
         foo = Foo
@@ -28,13 +29,6 @@ def test_lambda_dependency():
 def test_function_dependency():
     """Inject regular function."""
 
-    class Foo(object):
-        def __init__(self, add):
-            self.add = add
-
-        def do(self, x):
-            return self.add(x, x)
-
     def plus(x, y):
         return x + y
 
@@ -48,13 +42,6 @@ def test_function_dependency():
 def test_inline_dependency():
     """Inject method defined inside Injector subclass."""
 
-    class Foo(object):
-        def __init__(self, add):
-            self.add = add
-
-        def do(self, x):
-            return self.add(x, x)
-
     class Summator(Injector):
         foo = Foo
 
@@ -116,13 +103,6 @@ def test_redefine_dependency():
     subclass.
     """
 
-    class Foo(object):
-        def __init__(self, add):
-            self.add = add
-
-        def do(self, x):
-            return self.add(x, x)
-
     class Summator(Injector):
         foo = Foo
         add = lambda x, y: x + y  # noqa: E731
@@ -329,6 +309,27 @@ def test_let_factory_on_injector_directly():
     assert Injector.let(foo=Foo, bar=Bar, baz=1).foo.bar.baz == 1
 
 
+def test_let_factory_reuse_literal_subclasses():
+    """
+    `let` returns the same subclass for repeated literal overrides.
+
+    Values which compare equal but have different types, like `2` and
+    `2.0` or `True` and `1`, produce different subclasses.  Non-literal
+    values are never cached.
+    """
+
+    class Foo(Injector):
+        bar = 1
+
+    assert Foo.let(bar=2) is Foo.let(bar=2)
+    assert Foo.let(bar=2) is not Foo.let(bar=2.0)
+    assert Foo.let(bar=1) is not Foo.let(bar=True)
+    assert Foo.let(bar=2.0).bar == 2.0
+    assert isinstance(Foo.let(bar=2.0).bar, float)
+    assert Foo.let(bar=True).bar is True
+    assert Foo.let(bar=[1]) is not Foo.let(bar=[1])
+
+
 # Dir.
 
 
@@ -949,6 +950,41 @@ def c4362558f312(Foo):
     Injector.let(foo=Foo, args=(1, 2, 3), kwargs={"start": 5})
 
 
+deny_builtin_constructors = CodeCollector()
+
+
+@deny_builtin_constructors.parametrize
+def test_deny_builtin_type_constructors(code):
+    """
+    Raise `DependencyError` if constructor is inherited from a builtin
+    type and does not expose a code object.
+    """
+
+    class Foo(dict):
+        pass
+
+    with pytest.raises(DependencyError) as exc_info:
+        code(Foo)
+
+    message = str(exc_info.value)
+    assert message == "Foo.__init__ have arbitrary argument list and keyword arguments"
+
+
+@deny_builtin_constructors
+def b8e60cf6fda2(Foo):
+    """Declarative injector."""
+
+    class Summator(Injector):
+        foo = Foo
+
+
+@deny_builtin_constructors
+def fc2e34b86683(Foo):
+    """Let notation."""
+
+    Injector.let(foo=Foo)
+
+
 deny_let_redefine = CodeCollector()
 
 